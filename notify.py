@@ -4,10 +4,126 @@ Notification module for Pittsburgh School Job Scraper.
 Supports email (Gmail) and push notifications (ntfy.sh).
 """
 
+import atexit
 import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+
 import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 465
+
+# Shared HTTP session so repeated pushes to ntfy.sh reuse one TLS connection
+_HTTP = requests.Session()
+
+
+class _SMTPPool:
+    """Cache logged-in SMTP_SSL connections keyed by (host, user).
+
+    Opening an SMTP_SSL connection costs a TLS handshake plus AUTH on every
+    send. Reusing one connection across sends in the same process avoids
+    that; stale connections are health-checked with NOOP and reconnected.
+    """
+
+    _MAX_IDLE_SECONDS = 60
+    _connections: dict = {}  # (host, user) -> (server, last_used)
+    # Serializes cache access when notifications fire from worker threads
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, host: str, port: int, user: str, password: str) -> smtplib.SMTP_SSL:
+        """Return a cached, logged-in connection, reconnecting if stale."""
+        key = (host, user)
+        with cls._lock:
+            entry = cls._connections.get(key)
+            if entry is not None:
+                server, last_used = entry
+                if time.monotonic() - last_used < cls._MAX_IDLE_SECONDS:
+                    cls._connections[key] = (server, time.monotonic())
+                    return server
+                # Idle for a while - make sure the socket is still alive
+                try:
+                    server.noop()
+                    cls._connections[key] = (server, time.monotonic())
+                    return server
+                except (smtplib.SMTPException, OSError):
+                    cls._drop(key)
+
+            server = smtplib.SMTP_SSL(host, port)
+            server.login(user, password)
+            cls._connections[key] = (server, time.monotonic())
+            return server
+
+    @classmethod
+    def _drop(cls, key: tuple):
+        """Close and forget a cached connection. Caller must hold _lock."""
+        entry = cls._connections.pop(key, None)
+        if entry is not None:
+            try:
+                entry[0].close()
+            except Exception:
+                pass
+
+    @classmethod
+    def evict(cls, key: tuple):
+        """Drop a cached connection (e.g. after a send failed on it)."""
+        with cls._lock:
+            cls._drop(key)
+
+    @classmethod
+    def close_all(cls):
+        """Politely QUIT all cached connections (registered at exit)."""
+        with cls._lock:
+            for key in list(cls._connections):
+                server, _ = cls._connections.pop(key)
+                try:
+                    server.quit()
+                except Exception:
+                    pass
+
+
+atexit.register(_SMTPPool.close_all)
+
+
+def _send_via_pool(sender_email: str, receiver_email: str, password: str, body: bytes):
+    """Send through the pooled connection, reconnecting once on disconnect.
+
+    body is the message already serialized with as_bytes(), so a retry
+    after a dropped connection reuses it instead of re-rendering MIME.
+    """
+    server = _SMTPPool.get(SMTP_HOST, SMTP_PORT, sender_email, password)
+    try:
+        server.sendmail(sender_email, receiver_email, body)
+    except smtplib.SMTPException:
+        # Connection likely went stale between NOOP and send - retry once
+        _SMTPPool.evict((SMTP_HOST, sender_email))
+        server = _SMTPPool.get(SMTP_HOST, SMTP_PORT, sender_email, password)
+        server.sendmail(sender_email, receiver_email, body)
+
+
+def _job_rows(jobs: list[dict]) -> tuple[str, str]:
+    """Render the plain-text and HTML listing blocks for a set of jobs.
+
+    Built with join() rather than += in a loop, and HTML-escaped so a
+    title containing '<' can't break the message.
+    """
+    text_block = "".join(
+        f"• {job['title']}\n  District: {job['district']}\n  URL: {job['url']}\n\n"
+        for job in jobs
+    )
+    html_block = "".join(
+        "<li>"
+        f"<strong>{escape(job['title'])}</strong><br>"
+        f"District: {escape(job['district'])}<br>"
+        f"<a href=\"{escape(job['url'], quote=True)}\">View Posting</a>"
+        "</li><br>"
+        for job in jobs
+    )
+    return text_block, html_block
 
 
 def send_email(jobs: list[dict], config: dict) -> bool:
@@ -24,17 +140,15 @@ def send_email(jobs: list[dict], config: dict) -> bool:
         return False
 
     # Create message
-    msg = MIMEMultipart('alternative')
+    msg = EmailMessage()
     msg['Subject'] = f"🎓 {len(jobs)} Social Studies Teaching Position(s) Found!"
     msg['From'] = sender_email
     msg['To'] = receiver_email
 
+    rows_text, rows_html = _job_rows(jobs)
+
     # Plain text version
-    text_content = f"Found {len(jobs)} new social studies teaching position(s):\n\n"
-    for job in jobs:
-        text_content += f"• {job['title']}\n"
-        text_content += f"  District: {job['district']}\n"
-        text_content += f"  URL: {job['url']}\n\n"
+    text_content = f"Found {len(jobs)} new social studies teaching position(s):\n\n{rows_text}"
 
     # HTML version
     html_content = f"""
@@ -43,30 +157,18 @@ def send_email(jobs: list[dict], config: dict) -> bool:
         <h2>🎓 {len(jobs)} Social Studies Teaching Position(s) Found!</h2>
         <p>The following positions match your criteria:</p>
         <ul>
-    """
-    for job in jobs:
-        html_content += f"""
-            <li>
-                <strong>{job['title']}</strong><br>
-                District: {job['district']}<br>
-                <a href="{job['url']}">View Posting</a>
-            </li>
-            <br>
-        """
-    html_content += """
+        {rows_html}
         </ul>
         <p><em>Sent by Pittsburgh School Job Scraper</em></p>
     </body>
     </html>
     """
 
-    msg.attach(MIMEText(text_content, 'plain'))
-    msg.attach(MIMEText(html_content, 'html'))
+    msg.set_content(text_content)
+    msg.add_alternative(html_content, subtype='html')
 
     try:
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(sender_email, password)
-            server.sendmail(sender_email, receiver_email, msg.as_string())
+        _send_via_pool(sender_email, receiver_email, password, msg.as_bytes())
         print(f"Email sent to {receiver_email}")
         return True
     except Exception as e:
@@ -84,28 +186,23 @@ def send_push_notification(jobs: list[dict], config: dict) -> bool:
         print("ntfy topic not configured")
         return False
 
-    # Create message
-    title = f"🎓 {len(jobs)} Social Studies Position(s) Found!"
-
-    message = ""
-    for job in jobs[:5]:  # Limit to first 5 for push notification
-        message += f"• {job['title']} ({job['district']})\n"
-
+    # Limit to first 5 for push notification
+    lines = [f"• {job['title']} ({job['district']})" for job in jobs[:5]]
     if len(jobs) > 5:
-        message += f"\n... and {len(jobs) - 5} more"
+        lines.append(f"\n... and {len(jobs) - 5} more")
+    body = "\n".join(lines).encode('utf-8')
 
     try:
-        # Remove emoji from title for ntfy compatibility
-        clean_title = f"{len(jobs)} Social Studies Position(s) Found!"
-
-        response = requests.post(
+        # No emoji in the title for ntfy compatibility
+        response = _HTTP.post(
             f"https://ntfy.sh/{topic}",
             headers={
-                "Title": clean_title,
+                "Title": f"{len(jobs)} Social Studies Position(s) Found!",
                 "Priority": "high",
-                "Tags": "mortar_board,briefcase"
+                "Tags": "mortar_board,briefcase",
+                "Content-Type": "text/plain; charset=utf-8"
             },
-            data=message.encode('utf-8'),
+            data=body,
             timeout=10
         )
         response.raise_for_status()
@@ -127,12 +224,19 @@ def send_notifications(jobs: list[dict], config: dict) -> dict:
         print("No jobs to notify about")
         return results
 
-    # Send email if configured
-    if config.get('email_from') and config.get('email_password'):
+    email_configured = bool(config.get('email_from') and config.get('email_password'))
+    push_configured = bool(config.get('ntfy_topic'))
+
+    if email_configured and push_configured:
+        # Both channels are independent blocking I/O - run them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            email_future = executor.submit(send_email, jobs, config)
+            push_future = executor.submit(send_push_notification, jobs, config)
+            results['email'] = email_future.result()
+            results['push'] = push_future.result()
+    elif email_configured:
         results['email'] = send_email(jobs, config)
-
-    # Send push notification if configured
-    if config.get('ntfy_topic'):
+    elif push_configured:
         results['push'] = send_push_notification(jobs, config)
 
     return results
@@ -150,18 +254,11 @@ def send_test_notifications(config: dict) -> dict:
     return send_notifications(test_jobs, config)
 
 
-def send_status_email(total_jobs: int, new_jobs: int, jobs: list[dict], config: dict) -> bool:
-    """Send a status email summarizing the scrape run."""
-    sender_email = config.get('email_from')
-    receiver_email = config.get('email_to')
-    password = config.get('email_password')
-
-    if not all([sender_email, receiver_email, password]):
-        print("Email configuration incomplete")
-        return False
-
+def _build_status_message(total_jobs: int, new_jobs: int, jobs: list[dict],
+                          sender_email: str, receiver_email: str) -> bytes:
+    """Assemble the status email and serialize it to bytes exactly once."""
     # Create message
-    msg = MIMEMultipart('alternative')
+    msg = EmailMessage()
 
     if new_jobs > 0:
         msg['Subject'] = f"🎓 {new_jobs} NEW Social Studies Position(s) Found!"
@@ -175,27 +272,16 @@ def send_status_email(total_jobs: int, new_jobs: int, jobs: list[dict], config:
 
     # Build content
     if new_jobs > 0:
-        text_content = f"Found {new_jobs} NEW social studies teaching position(s)!\n\n"
+        rows_text, rows_html = _job_rows(jobs)
+        text_content = f"Found {new_jobs} NEW social studies teaching position(s)!\n\n{rows_text}"
         html_content = f"""
         <html>
         <body>
             <h2>🎓 {new_jobs} NEW Social Studies Position(s) Found!</h2>
             <p>The following NEW positions match your criteria:</p>
             <ul>
-        """
-        for job in jobs:
-            text_content += f"• {job['title']}\n"
-            text_content += f"  District: {job['district']}\n"
-            text_content += f"  URL: {job['url']}\n\n"
-            html_content += f"""
-                <li>
-                    <strong>{job['title']}</strong><br>
-                    District: {job['district']}<br>
-                    <a href="{job['url']}">View Posting</a>
-                </li>
-                <br>
-            """
-        html_content += "</ul>"
+            {rows_html}
+            </ul>"""
     elif total_jobs > 0:
         text_content = f"Daily scrape completed. {total_jobs} social studies position(s) still open (no new ones today).\n"
         html_content = f"""
@@ -222,13 +308,26 @@ def send_status_email(total_jobs: int, new_jobs: int, jobs: list[dict], config:
         </html>
     """
 
-    msg.attach(MIMEText(text_content, 'plain'))
-    msg.attach(MIMEText(html_content, 'html'))
+    msg.set_content(text_content)
+    msg.add_alternative(html_content, subtype='html')
+
+    return msg.as_bytes()
+
+
+def send_status_email(total_jobs: int, new_jobs: int, jobs: list[dict], config: dict) -> bool:
+    """Send a status email summarizing the scrape run."""
+    sender_email = config.get('email_from')
+    receiver_email = config.get('email_to')
+    password = config.get('email_password')
+
+    if not all([sender_email, receiver_email, password]):
+        print("Email configuration incomplete")
+        return False
+
+    body = _build_status_message(total_jobs, new_jobs, jobs, sender_email, receiver_email)
 
     try:
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(sender_email, password)
-            server.sendmail(sender_email, receiver_email, msg.as_string())
+        _send_via_pool(sender_email, receiver_email, password, body)
         print(f"Status email sent to {receiver_email}")
         return True
     except Exception as e:
@@ -4,6 +4,7 @@ Automated job scraper runner with notifications.
 Run this script via cron to check for new jobs daily.
 """
 
+import functools
 import json
 import os
 import sys
@@ -14,12 +15,58 @@ from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
-from scraper import load_config, scrape_all_districts, filter_jobs
+from scraper import load_config, scrape_all_districts, filter_and_diff
 from notify import send_notifications, send_test_notifications
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+def _write_json_atomic(path: Path, data: dict):
+    """Write JSON to a temp file then rename, so a crash can't corrupt it.
+
+    A half-written cache would make the next run treat every job as new
+    and spam notifications.
+    """
+    tmp = path.with_suffix('.tmp')
+    if ORJSON_AVAILABLE:
+        tmp.write_bytes(orjson.dumps(data))
+    else:
+        tmp.write_text(json.dumps(data, separators=(',', ':')))
+    tmp.replace(path)
+
+
+def _validate_settings(settings: dict):
+    """Fail fast on a half-configured channel, before any scraping starts.
+
+    Without this, a missing email key only surfaces inside send_email
+    after the whole scrape has already run.
+    """
+    if settings.get('email_from') or settings.get('email_password'):
+        missing = [key for key in ('email_from', 'email_to', 'email_password')
+                   if not settings.get(key)]
+        if missing:
+            print(f"ERROR: settings.json is missing {', '.join(missing)} - "
+                  "email notifications need all three.")
+            sys.exit(1)
+
+    if not settings.get('email_from') and not settings.get('ntfy_topic'):
+        print("WARNING: no notification channels configured in settings.json")
+
+
+@functools.cache
 def load_settings() -> dict:
-    """Load notification settings."""
+    """Load and validate notification settings (parsed once per process)."""
     settings_path = script_dir / 'settings.json'
 
     if not settings_path.exists():
@@ -27,22 +74,30 @@ def load_settings() -> dict:
         print("Copy settings.example.json to settings.json and fill in your credentials.")
         sys.exit(1)
 
-    with open(settings_path) as f:
-        return json.load(f)
+    settings = _read_json(settings_path)
+    _validate_settings(settings)
+    return settings
 
 
 def load_previous_jobs() -> set:
-    """Load job IDs from previous run."""
+    """Load (district, title) job keys from previous run."""
     cache_path = script_dir / '.job_cache.json'
 
     if not cache_path.exists():
         return set()
 
     try:
-        with open(cache_path) as f:
-            data = json.load(f)
-            return set(data.get('job_ids', []))
-    except:
+        data = _read_json(cache_path)
+        job_ids = set()
+        for entry in data.get('job_ids', []):
+            if isinstance(entry, str):
+                # Cache written before the move to [district, title] pairs
+                district, _, title = entry.partition('|')
+                job_ids.add((district, title))
+            else:
+                job_ids.add(tuple(entry))
+        return job_ids
+    except (ValueError, OSError):
         return set()
 
 
@@ -50,11 +105,8 @@ def save_current_jobs(jobs: list[dict]):
     """Save current job IDs for next run comparison."""
     cache_path = script_dir / '.job_cache.json'
 
-    # Create unique ID for each job
-    job_ids = []
-    for job in jobs:
-        job_id = f"{job['district']}|{job['title']}"
-        job_ids.append(job_id)
+    # Unique (district, title) key for each job
+    job_ids = [[job['district'], job['title']] for job in jobs]
 
     data = {
         'last_run': datetime.now().isoformat(),
@@ -62,20 +114,13 @@ def save_current_jobs(jobs: list[dict]):
         'job_ids': job_ids
     }
 
-    with open(cache_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json_atomic(cache_path, data)
 
 
 def get_new_jobs(current_jobs: list[dict], previous_ids: set) -> list[dict]:
     """Find jobs that weren't in the previous run."""
-    new_jobs = []
-
-    for job in current_jobs:
-        job_id = f"{job['district']}|{job['title']}"
-        if job_id not in previous_ids:
-            new_jobs.append(job)
-
-    return new_jobs
+    return [job for job in current_jobs
+            if (job['district'], job['title']) not in previous_ids]
 
 
 def run_scraper():
@@ -95,15 +140,12 @@ def run_scraper():
     print("Scraping all districts for social studies positions...\n")
     all_jobs = scrape_all_districts(config, verbose=True)
 
-    # Filter for social studies positions
-    filtered_jobs = filter_jobs(all_jobs, social_studies_only=True)
-
-    print(f"\nFound {len(filtered_jobs)} social studies position(s)")
-
-    # Load previous jobs and find new ones
+    # Filter for social studies positions and diff against the previous
+    # run in a single pass
     previous_ids = load_previous_jobs()
-    new_jobs = get_new_jobs(filtered_jobs, previous_ids)
+    filtered_jobs, new_jobs = filter_and_diff(all_jobs, previous_ids)
 
+    print(f"\nFound {len(filtered_jobs)} social studies position(s)")
     print(f"New since last run: {len(new_jobs)}")
 
     # Save current jobs for next run
@@ -127,13 +169,12 @@ def run_scraper():
 
     # Save results to file
     output_path = script_dir / 'latest_results.json'
-    with open(output_path, 'w') as f:
-        json.dump({
-            'scraped_at': datetime.now().isoformat(),
-            'total_jobs': len(filtered_jobs),
-            'new_jobs': len(new_jobs),
-            'jobs': filtered_jobs
-        }, f, indent=2)
+    _write_json_atomic(output_path, {
+        'scraped_at': datetime.now().isoformat(),
+        'total_jobs': len(filtered_jobs),
+        'new_jobs': len(new_jobs),
+        'jobs': filtered_jobs
+    })
 
     print(f"\nResults saved to: {output_path}")
     print(f"{'='*60}\n")
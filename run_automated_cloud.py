@@ -7,18 +7,25 @@ Designed for GitHub Actions - stores results in Supabase instead of local files.
 import json
 import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path for imports
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
-from scraper import load_config, scrape_all_districts, filter_jobs
+from scraper import load_config, iter_district_jobs, job_passes_filters
 from notify import send_status_email
 
+# Filtered jobs are uploaded in batches of this size while scraping continues
+UPLOAD_BATCH_SIZE = 50
+
 
 def get_env_config() -> dict:
     """Load configuration from environment variables."""
@@ -39,6 +46,60 @@ def get_env_config() -> dict:
     }
 
 
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker is open and a request is skipped."""
+
+
+class _CircuitBreaker:
+    """Stop hammering a backend that keeps failing.
+
+    Trips open after failure_threshold consecutive failures; after
+    reset_timeout seconds one probe request is let through (half-open),
+    and a success closes the circuit again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None  # None = closed
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        # Half-open: allow a probe once the reset timeout has elapsed
+        return time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+def _build_retry() -> Retry:
+    """Retry transient failures with exponential backoff (1s, 2s, 4s)."""
+    kwargs = dict(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST', 'PATCH']),
+        respect_retry_after_header=True
+    )
+    try:
+        # backoff_jitter (±fraction of the delay) needs urllib3 >= 2.0
+        return Retry(backoff_jitter=0.1, **kwargs)
+    except TypeError:
+        return Retry(**kwargs)
+
+
+# Client errors that retrying can never fix
+_PERMANENT_STATUSES = {400, 401, 403, 404}
+
+
 class SupabaseClient:
     """Simple Supabase REST API client."""
 
@@ -50,29 +111,72 @@ class SupabaseClient:
             'Content-Type': 'application/json',
             'Prefer': 'return=representation'
         }
+        # One session for all calls so TCP+TLS to Supabase is set up once
+        # and reused (urllib3 connection pooling + HTTP keep-alive).
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=_build_retry()))
+        self.breaker = _CircuitBreaker()
+
+    def close(self):
+        """Release pooled connections."""
+        self.session.close()
+
+    def _request(self, method: str, table: str, data: dict = None, params: dict = None,
+                 headers: dict = None):
+        """Make a request to Supabase REST API through the circuit breaker."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Supabase circuit breaker open - skipping {method} {table}")
 
-    def _request(self, method: str, table: str, data: dict = None, params: dict = None):
-        """Make a request to Supabase REST API."""
         url = f"{self.url}/rest/v1/{table}"
-        response = requests.request(
-            method,
-            url,
-            headers=self.headers,
-            json=data,
-            params=params,
-            timeout=30
-        )
+        try:
+            response = self.session.request(
+                method,
+                url,
+                json=data,
+                params=params,
+                headers=headers,
+                timeout=30
+            )
+        except requests.RequestException:
+            self.breaker.record_failure()
+            raise
+
+        if not response.ok and response.status_code not in _PERMANENT_STATUSES:
+            # Transient server-side failure (adapter retries already ran)
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
         response.raise_for_status()
         return response.json() if response.text else None
 
-    def get_existing_job_ids(self) -> set:
-        """Get all existing job IDs (district|title) from database."""
+    # Page size for the active-jobs snapshot; PostgREST caps (and silently
+    # truncates) unbounded selects, so page until a short page comes back
+    PAGE_SIZE = 1000
+
+    def get_active_jobs(self) -> list[dict]:
+        """Get id/district/title for every active job, paging past the row cap."""
         params = {
-            'select': 'district,title',
+            'select': 'id,district,title',
             'is_active': 'eq.true'
         }
-        jobs = self._request('GET', 'jobs', params=params)
-        return {f"{job['district']}|{job['title']}" for job in jobs}
+        jobs = []
+        offset = 0
+        while True:
+            page = self._request('GET', 'jobs', params=params, headers={
+                'Range-Unit': 'items',
+                'Range': f'{offset}-{offset + self.PAGE_SIZE - 1}'
+            })
+            jobs.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                return jobs
+            offset += self.PAGE_SIZE
+
+    def get_existing_job_ids(self) -> set:
+        """Get all existing (district, title) job keys from database."""
+        return {(job['district'], job['title']) for job in self.get_active_jobs()}
 
     def create_scrape_run(self) -> str:
         """Create a new scrape run record and return its ID."""
@@ -84,7 +188,7 @@ class SupabaseClient:
         """Update scrape run with results."""
         data = {
             'status': status,
-            'completed_at': datetime.utcnow().isoformat(),
+            'completed_at': datetime.now(timezone.utc).isoformat(),
             'total_jobs_found': total_jobs,
             'new_jobs_found': new_jobs,
             'error_message': error
@@ -92,70 +196,105 @@ class SupabaseClient:
         params = {'id': f'eq.{run_id}'}
         self._request('PATCH', 'scrape_runs', data=data, params=params)
 
-    def upsert_jobs(self, jobs: list[dict]) -> list[dict]:
-        """Insert or update jobs, return list of newly inserted jobs."""
+    def touch_jobs(self, job_keys: set):
+        """Refresh last_seen_at/is_active for already-known jobs in one RPC."""
+        if not job_keys:
+            return
+        keys = [{'district': district, 'title': title} for district, title in job_keys]
+        self._request('POST', 'rpc/touch_jobs', data={'keys': keys})
+
+    def upsert_jobs(self, jobs: list[dict], active_jobs: list[dict] = None) -> list[dict]:
+        """Insert new jobs, touch existing ones, return newly inserted jobs.
+
+        Only genuinely new rows are POSTed; jobs already tracked get their
+        last_seen_at refreshed through the touch_jobs RPC (one bulk UPDATE
+        instead of re-upserting every open job on every run). Pass the
+        result of get_active_jobs() as active_jobs to avoid an extra
+        round-trip when the caller already fetched it.
+        """
         if not jobs:
             return []
 
-        new_jobs = []
+        if active_jobs is not None:
+            existing = {(job['district'], job['title']) for job in active_jobs}
+        else:
+            existing = self.get_existing_job_ids()
+
+        # One timestamp for the whole batch - it's a single scrape instant
+        now_iso = datetime.now(timezone.utc).isoformat()
+        payload = {}
         for job in jobs:
-            data = {
+            key = (job['district'], job['title'])
+            if key in existing:
+                continue  # refreshed via touch_jobs below
+            # Postgres rejects a bulk upsert that touches the same row twice
+            payload[key] = {
                 'district': job['district'],
                 'title': job['title'],
                 'url': job['url'],
                 'portal_type': job.get('portal_type'),
-                'last_seen_at': datetime.utcnow().isoformat(),
+                'last_seen_at': now_iso,
                 'is_active': True
             }
 
-            # Try to insert, if conflict update last_seen_at
+        rows = []
+        if payload:
             headers = {**self.headers, 'Prefer': 'resolution=merge-duplicates,return=representation'}
-            url = f"{self.url}/rest/v1/jobs"
-
-            response = requests.post(
-                url,
+            response = self.session.post(
+                f"{self.url}/rest/v1/jobs",
                 headers=headers,
-                json=data,
+                json=list(payload.values()),
                 params={'on_conflict': 'district,title'},
                 timeout=30
             )
+            response.raise_for_status()
+            rows = response.json() if response.text else []
 
-            if response.status_code == 201:
-                # New job inserted
-                result = response.json()
-                if result and not result[0].get('notified'):
-                    new_jobs.append({**job, 'id': result[0]['id']})
-            elif response.status_code == 200:
-                # Job updated (already existed)
-                pass
-            else:
-                response.raise_for_status()
+        # One bulk UPDATE for every job that was already in the table
+        current_keys = {(job['district'], job['title']) for job in jobs}
+        self.touch_jobs(current_keys & existing)
+
+        rows_by_key = {(row['district'], row['title']): row for row in rows}
+        new_jobs = []
+        for job in jobs:
+            key = (job['district'], job['title'])
+            if key in existing:
+                continue
+            row = rows_by_key.get(key)
+            if row and not row.get('notified'):
+                new_jobs.append({**job, 'id': row['id']})
 
         return new_jobs
 
+    # How many IDs to pack into one in.(...) filter before the URL gets long
+    PATCH_CHUNK_SIZE = 200
+
+    def _patch_jobs_by_id(self, job_ids: list[str], data: dict):
+        """Bulk-update jobs by ID with a single PATCH per chunk of IDs."""
+        for start in range(0, len(job_ids), self.PATCH_CHUNK_SIZE):
+            chunk = job_ids[start:start + self.PATCH_CHUNK_SIZE]
+            params = {'id': f"in.({','.join(str(i) for i in chunk)})"}
+            self._request('PATCH', 'jobs', data=data, params=params)
+
     def mark_jobs_notified(self, job_ids: list[str]):
         """Mark jobs as notified."""
         if not job_ids:
             return
+        self._patch_jobs_by_id(job_ids, {'notified': True})
 
-        for job_id in job_ids:
-            params = {'id': f'eq.{job_id}'}
-            data = {'notified': True}
-            self._request('PATCH', 'jobs', data=data, params=params)
-
-    def mark_missing_jobs_inactive(self, current_job_keys: set):
-        """Mark jobs not in current scrape as inactive."""
-        # Get all active jobs
-        params = {'select': 'id,district,title', 'is_active': 'eq.true'}
-        active_jobs = self._request('GET', 'jobs', params=params)
+    def mark_missing_jobs_inactive(self, active_jobs: list[dict], current_job_keys: set):
+        """Mark jobs not in current scrape as inactive.
 
+        active_jobs is the snapshot from get_active_jobs() taken at the
+        start of the run, so no extra fetch is needed here.
+        """
         # Find jobs that weren't seen in this scrape
-        for job in active_jobs:
-            job_key = f"{job['district']}|{job['title']}"
-            if job_key not in current_job_keys:
-                params = {'id': f"eq.{job['id']}"}
-                data = {'is_active': False}
-                self._request('PATCH', 'jobs', data=data, params=params)
+        stale_ids = [
+            job['id'] for job in active_jobs
+            if (job['district'], job['title']) not in current_job_keys
+        ]
+        if stale_ids:
+            self._patch_jobs_by_id(stale_ids, {'is_active': False})
 
     def log_notification(self, run_id: str, notification_type: str, jobs_count: int, success: bool, error: str = None):
         """Log a notification attempt."""
@@ -173,7 +312,7 @@ def run_scraper():
     """Main function to run cloud-based automated scraper."""
     print(f"\n{'='*60}")
     print(f"Pittsburgh School Job Scraper - Cloud Run")
-    print(f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
+    print(f"Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC")
     print(f"{'='*60}\n")
 
     # Load configuration
@@ -190,32 +329,46 @@ def run_scraper():
         # Load district config
         district_config = load_config(script_dir / 'config.json')
 
-        # Run scraper
-        print("\nScraping all districts for social studies positions...\n")
-        all_jobs = scrape_all_districts(district_config, verbose=True)
+        # Snapshot active jobs once; reused for new-job detection and
+        # stale-job cleanup below
+        active_jobs = db.get_active_jobs()
 
-        # Filter for social studies positions
-        filtered_jobs = filter_jobs(all_jobs, social_studies_only=True)
+        # Stream the scrape: filter each job as it arrives and upload in
+        # batches so database writes overlap the remaining districts
+        print("\nScraping all districts for social studies positions...\n")
+        filtered_jobs = []
+        new_jobs = []
+        batch = []
+        for job in iter_district_jobs(district_config, verbose=True):
+            if not job_passes_filters(job):
+                continue
+            filtered_jobs.append(job)
+            batch.append(job)
+            if len(batch) >= UPLOAD_BATCH_SIZE:
+                new_jobs.extend(db.upsert_jobs(batch, active_jobs))
+                batch.clear()
+        if batch:
+            new_jobs.extend(db.upsert_jobs(batch, active_jobs))
 
         print(f"\nFound {len(filtered_jobs)} social studies position(s)")
-
-        # Upsert jobs to database and get new ones
-        new_jobs = db.upsert_jobs(filtered_jobs)
-
         print(f"New jobs: {len(new_jobs)}")
 
-        # Mark jobs not in this scrape as inactive
-        current_job_keys = {f"{job['district']}|{job['title']}" for job in filtered_jobs}
-        db.mark_missing_jobs_inactive(current_job_keys)
-
-        # Send status email (always, so user knows the scraper ran)
         if new_jobs:
             print(f"\nFound {len(new_jobs)} NEW position(s)!")
             for job in new_jobs:
                 print(f"  - {job['title']} ({job['district']})")
 
+        # Stale-job cleanup and the status email (always sent, so the user
+        # knows the scraper ran) are independent I/O - overlap them
+        current_job_keys = {(job['district'], job['title']) for job in filtered_jobs}
         print("\nSending status email...")
-        email_sent = send_status_email(len(filtered_jobs), len(new_jobs), new_jobs, config)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            inactive_future = executor.submit(
+                db.mark_missing_jobs_inactive, active_jobs, current_job_keys)
+            email_future = executor.submit(
+                send_status_email, len(filtered_jobs), len(new_jobs), new_jobs, config)
+            inactive_future.result()
+            email_sent = email_future.result()
 
         if email_sent:
             print("Status email sent")
@@ -240,9 +393,16 @@ def run_scraper():
 
     except Exception as e:
         print(f"\nERROR: {e}")
-        db.update_scrape_run(run_id, 'failed', 0, 0, str(e))
+        try:
+            db.update_scrape_run(run_id, 'failed', 0, 0, str(e))
+        except (requests.RequestException, CircuitOpenError) as update_err:
+            # Supabase itself is down - don't let bookkeeping mask the error
+            print(f"Could not record failed run: {update_err}")
         raise
 
+    finally:
+        db.close()
+
 
 if __name__ == '__main__':
     run_scraper()
@@ -6,14 +6,23 @@ Scrapes job listings from 20 school districts in the Pittsburgh area.
 Supports AppliTrack, PowerSchool, PAEducator, and custom district websites.
 """
 
+import functools
 import json
 import argparse
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from scrapers import scrape_applitrack, scrape_powerschool, scrape_paeducator, scrape_schoolspring, scrape_other
 
+# Districts scraped concurrently. The work is network-bound (HTTP requests
+# and page renders), so threads overlap the wait time across districts.
+MAX_CONCURRENT_DISTRICTS = 8
+
 
 # Keywords for social studies positions
 SOCIAL_STUDIES_KEYWORDS = [
@@ -66,6 +75,47 @@ EXCLUDE_KEYWORDS = [
     'k-5', 'k-6', 'k-4', 'k-3',
 ]
 
+# Keywords for substitute/temporary positions
+SUBSTITUTE_KEYWORDS = [
+    'substitute', 'sub ', 'per diem', 'day-to-day', 'day to day',
+    'guest teacher', 'building substitute', 'long-term sub',
+    'long term sub', 'homebound', 'student teacher',
+    'retiree', 'psers'
+]
+
+# Keywords for coaching/athletic positions
+COACHING_KEYWORDS = [
+    'coach', 'athletic', 'head coach', 'assistant coach',
+    'event worker', 'jrotc', 'rotc'
+]
+
+# Keywords for non-teaching support positions
+NON_TEACHING_KEYWORDS = [
+    'aide', 'paraprofessional', 'assistant', 'pca',
+    'custodian', 'maintenance', 'cafeteria', 'food service',
+    'secretary', 'clerical', 'bus driver', 'transportation',
+    'nurse', 'support staff', 'mechanic', 'social worker',
+    'counselor', 'psychologist'  # these are different roles
+]
+
+
+def _keywords_pattern(keywords: list[str]) -> re.Pattern:
+    """Compile a keyword list into one alternation matched in a single scan.
+
+    any(kw in text for kw in keywords) rescans the text once per keyword
+    at Python level; the compiled alternation finds any keyword in one
+    pass of the C regex engine.
+    """
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+SOCIAL_STUDIES_RE = _keywords_pattern(SOCIAL_STUDIES_KEYWORDS)
+SECONDARY_RE = _keywords_pattern(SECONDARY_KEYWORDS)
+EXCLUDE_RE = _keywords_pattern(EXCLUDE_KEYWORDS)
+SUBSTITUTE_RE = _keywords_pattern(SUBSTITUTE_KEYWORDS)
+COACHING_RE = _keywords_pattern(COACHING_KEYWORDS)
+NON_TEACHING_RE = _keywords_pattern(NON_TEACHING_KEYWORDS)
+
 
 def is_social_studies_job(job: dict) -> bool:
     """Check if a job is related to social studies.
@@ -73,20 +123,28 @@ def is_social_studies_job(job: dict) -> bool:
     Primary check is in job title. Also checks position_type and category
     but NOT search_term (which would include all results from a search).
     """
-    title = job.get('title', '').lower()
-    position_type = job.get('position_type', '').lower()
-    category = job.get('category', '').lower()
+    return _is_social_studies(job.get('title', '').lower(),
+                              job.get('position_type', '').lower(),
+                              job.get('category', '').lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_social_studies(title: str, position_type: str, category: str) -> bool:
+    """Cached check on already-lowercased fields.
 
+    Identical titles/position types repeat heavily across districts, so
+    repeats become an O(1) lookup instead of a rescan.
+    """
     # Primary: title must contain a social studies keyword
-    if any(kw in title for kw in SOCIAL_STUDIES_KEYWORDS):
+    if SOCIAL_STUDIES_RE.search(title):
         return True
 
     # Secondary: check position_type (e.g., "Social Studies Teacher")
-    if any(kw in position_type for kw in SOCIAL_STUDIES_KEYWORDS):
+    if SOCIAL_STUDIES_RE.search(position_type):
         return True
 
     # Also check category field if present
-    if category and any(kw in category for kw in SOCIAL_STUDIES_KEYWORDS):
+    if category and SOCIAL_STUDIES_RE.search(category):
         return True
 
     return False
@@ -94,40 +152,34 @@ def is_social_studies_job(job: dict) -> bool:
 
 def is_teaching_position(job: dict) -> bool:
     """Check if a job is a full-time teaching position (not substitute/aide/coach)."""
-    title = job.get('title', '').lower()
-    position_type = job.get('position_type', '').lower()
+    return _is_teaching(job.get('title', '').lower(),
+                        job.get('position_type', '').lower())
+
 
-    combined = title + ' ' + position_type
+@functools.lru_cache(maxsize=4096)
+def _is_teaching(title: str, position_type: str) -> bool:
+    """Cached check on already-lowercased fields.
 
-    # Exclude substitute/temporary positions
-    substitute_keywords = [
-        'substitute', 'sub ', 'per diem', 'day-to-day', 'day to day',
-        'guest teacher', 'building substitute', 'long-term sub',
-        'long term sub', 'homebound', 'student teacher',
-        'retiree', 'psers'
-    ]
-    if any(kw in combined for kw in substitute_keywords):
+    Fields are searched separately rather than concatenated, avoiding a
+    new string allocation per call; the title goes first since it is
+    the more discriminative field.
+    """
+    # Exclude substitute/temporary positions. The 'sub ' keyword carries
+    # a deliberate trailing space (so 'subject' doesn't match), which
+    # used to hit titles *ending* in 'sub' via the space that joined the
+    # concatenated fields - the endswith check keeps catching those.
+    if (SUBSTITUTE_RE.search(title) or SUBSTITUTE_RE.search(position_type)
+            or title.endswith('sub')):
         return False
 
     # Exclude coaching/athletic positions
-    coaching_keywords = [
-        'coach', 'athletic', 'head coach', 'assistant coach',
-        'event worker', 'jrotc', 'rotc'
-    ]
-    if any(kw in combined for kw in coaching_keywords):
+    if COACHING_RE.search(title) or COACHING_RE.search(position_type):
         return False
 
     # Exclude non-teaching support positions
-    exclude_types = [
-        'aide', 'paraprofessional', 'assistant', 'pca',
-        'custodian', 'maintenance', 'cafeteria', 'food service',
-        'secretary', 'clerical', 'bus driver', 'transportation',
-        'nurse', 'support staff', 'mechanic', 'social worker',
-        'counselor', 'psychologist'  # these are different roles
-    ]
-    if any(ex in combined for ex in exclude_types):
+    if NON_TEACHING_RE.search(title) or NON_TEACHING_RE.search(position_type):
         # But include if it's explicitly a teaching position
-        if 'teacher' in combined and 'substitute' not in combined:
+        if 'teacher' in title or 'teacher' in position_type:
             return True
         return False
 
@@ -136,16 +188,20 @@ def is_teaching_position(job: dict) -> bool:
 
 def is_secondary_level(job: dict) -> bool:
     """Check if a job is for middle/high school (not elementary)."""
-    title = job.get('title', '').lower()
-    location = job.get('location', '').lower()
-    combined = title + ' ' + location
+    return _is_secondary(job.get('title', '').lower(),
+                         job.get('location', '').lower())
 
+
+@functools.lru_cache(maxsize=4096)
+def _is_secondary(title: str, location: str) -> bool:
+    """Cached check on already-lowercased fields, searched separately
+    to avoid a per-call concatenation."""
     # If explicitly elementary, exclude
-    if any(kw in combined for kw in EXCLUDE_KEYWORDS):
+    if EXCLUDE_RE.search(title) or EXCLUDE_RE.search(location):
         return False
 
     # If explicitly secondary, include
-    if any(kw in combined for kw in SECONDARY_KEYWORDS):
+    if SECONDARY_RE.search(title) or SECONDARY_RE.search(location):
         return True
 
     # If no grade level specified, include it (could be any level)
@@ -153,28 +209,48 @@ def is_secondary_level(job: dict) -> bool:
     return True
 
 
+def job_passes_filters(job: dict) -> bool:
+    """Check a single job against all three social studies criteria.
+
+    Lowercases each field once and feeds the cached predicates directly,
+    instead of each public wrapper re-extracting and re-lowercasing the
+    same title/position_type. Short-circuits on the first failed check.
+    """
+    title = job.get('title', '').lower()
+    position_type = job.get('position_type', '').lower()
+
+    # Must be social studies related, a teaching position, and secondary
+    # level (or unspecified)
+    return (_is_social_studies(title, position_type, job.get('category', '').lower())
+            and _is_teaching(title, position_type)
+            and _is_secondary(title, job.get('location', '').lower()))
+
+
 def filter_jobs(jobs: list[dict], social_studies_only: bool = False) -> list[dict]:
     """Filter jobs based on criteria."""
     if not social_studies_only:
         return jobs
 
-    filtered = []
-    for job in jobs:
-        # Must be social studies related
-        if not is_social_studies_job(job):
-            continue
+    return [job for job in jobs if job_passes_filters(job)]
 
-        # Must be a teaching position
-        if not is_teaching_position(job):
-            continue
 
-        # Must be secondary level (or unspecified)
-        if not is_secondary_level(job):
-            continue
+def filter_and_diff(jobs: list[dict], previous_ids: set) -> tuple[list[dict], list[dict]]:
+    """Filter to social studies positions and split out unseen jobs in one pass.
 
+    Fuses filter_jobs and the new-job diff so the job list is traversed
+    once. Returns (filtered, new) where new holds the filtered jobs whose
+    (district, title) key is not in previous_ids.
+    """
+    filtered = []
+    new_jobs = []
+    for job in jobs:
+        if not job_passes_filters(job):
+            continue
         filtered.append(job)
+        if (job['district'], job['title']) not in previous_ids:
+            new_jobs.append(job)
 
-    return filtered
+    return filtered, new_jobs
 
 
 def load_config(config_path: str = 'config.json') -> dict:
@@ -219,38 +295,80 @@ def scrape_district(school: dict) -> list[dict]:
     return jobs
 
 
-def scrape_all_districts(config: dict, verbose: bool = True) -> list[dict]:
-    """Scrape jobs from all configured school districts."""
-    all_jobs = []
+def _scrape_district_safe(school: dict) -> list[dict]:
+    """scrape_district wrapper that never lets one district kill the run."""
+    try:
+        return scrape_district(school)
+    except Exception as e:
+        print(f"  Error scraping {school['name']}: {e}")
+        return []
 
-    for school in config['schools']:
-        name = school['name']
-        if verbose:
-            print(f"Scraping {name}...")
 
-        jobs = scrape_district(school)
-        all_jobs.extend(jobs)
+def _dedup_key(job: dict) -> tuple:
+    """Global dedupe key: same district + same lowercased title.
 
-        if verbose:
-            print(f"  Found {len(jobs)} job(s)")
+    Districts cross-post the same opening to several portals (e.g.
+    PAEducator and their own site), so keying on (district, title)
+    catches those duplicates across sources. A tuple of small strings
+    hashes cheaply and, unlike a raw hash value, can never collide two
+    distinct postings into one.
+    """
+    return (job['district'], job['title'].lower())
+
+
+def iter_district_jobs(config: dict, verbose: bool = True):
+    """Yield jobs district by district as they are scraped.
+
+    Districts are scraped concurrently (bounded by
+    MAX_CONCURRENT_DISTRICTS) since the work is network-bound; results
+    are yielded in config order as each district finishes. Consumers
+    (e.g. batched uploaders) can start on early districts' jobs while
+    later ones are still in flight. Cross-source duplicates within a
+    district are dropped as jobs stream out.
+    """
+    schools = config['schools']
+    workers = max(1, min(MAX_CONCURRENT_DISTRICTS, len(schools)))
+    seen = set()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for school, jobs in zip(schools, executor.map(_scrape_district_safe, schools)):
+            if verbose:
+                print(f"Scraped {school['name']}: {len(jobs)} job(s)")
+            for job in jobs:
+                key = _dedup_key(job)
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield job
 
-    return all_jobs
 
+def scrape_all_districts(config: dict, verbose: bool = True) -> list[dict]:
+    """Scrape jobs from all configured school districts."""
+    return list(iter_district_jobs(config, verbose=verbose))
+
+
+def save_results(jobs: list[dict], output_path: str = None,
+                 compact: bool = False) -> str:
+    """Save results to a JSON file.
 
-def save_results(jobs: list[dict], output_path: str = None) -> str:
-    """Save results to a JSON file."""
+    Pretty-printing costs a Python-level write per line, which adds up
+    on large job lists; compact=True switches to minimal separators.
+    """
+    now = datetime.now()
     if output_path is None:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_path = f'jobs_{timestamp}.json'
+        output_path = f"jobs_{now.strftime('%Y%m%d_%H%M%S')}.json"
 
     output = {
-        'scraped_at': datetime.now().isoformat(),
+        'scraped_at': now.isoformat(),
         'total_jobs': len(jobs),
         'jobs': jobs
     }
 
     with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
+        if compact:
+            json.dump(output, f, separators=(',', ':'))
+        else:
+            json.dump(output, f, indent=2)
 
     return output_path
 
@@ -261,42 +379,31 @@ def print_summary(jobs: list[dict]):
     print("SCRAPING COMPLETE")
     print("=" * 60)
 
-    # Count by district
-    by_district = {}
-    for job in jobs:
-        district = job['district']
-        by_district[district] = by_district.get(district, 0) + 1
+    by_district = Counter(job['district'] for job in jobs)
+    by_source = Counter(job['source'] for job in jobs)
 
     print(f"\nTotal jobs found: {len(jobs)}")
     print("\nJobs by district:")
     for district, count in sorted(by_district.items()):
         print(f"  {district}: {count}")
 
-    # Count by source
-    by_source = {}
-    for job in jobs:
-        source = job['source']
-        by_source[source] = by_source.get(source, 0) + 1
-
     print("\nJobs by source type:")
     for source, count in sorted(by_source.items()):
         print(f"  {source}: {count}")
 
 
 def print_jobs(jobs: list[dict]):
-    """Print all job listings."""
+    """Print all job listings, grouped by district."""
     print("\n" + "=" * 60)
     print("JOB LISTINGS")
     print("=" * 60)
 
-    current_district = None
-    for job in sorted(jobs, key=lambda x: x['district']):
-        if job['district'] != current_district:
-            current_district = job['district']
-            print(f"\n--- {current_district} ---")
-
-        print(f"  * {job['title']}")
-        print(f"    {job['url']}")
+    by_district = itemgetter('district')
+    for district, group in groupby(sorted(jobs, key=by_district), key=by_district):
+        print(f"\n--- {district} ---")
+        for job in group:
+            print(f"  * {job['title']}")
+            print(f"    {job['url']}")
 
 
 def main():
@@ -331,6 +438,16 @@ def main():
         action='store_true',
         help='Do not save results to file'
     )
+    parser.add_argument(
+        '--compact-json',
+        action='store_true',
+        help='Write output JSON without indentation (smaller/faster)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not serve district pages from the on-disk HTTP cache'
+    )
     parser.add_argument(
         '--social-studies',
         action='store_true',
@@ -339,6 +456,10 @@ def main():
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        from scrapers.http import disable_cache
+        disable_cache()
+
     # Load configuration
     script_dir = Path(__file__).parent
     config_path = script_dir / args.config
@@ -375,7 +496,7 @@ def main():
 
     # Save results
     if not args.no_save:
-        output_path = save_results(jobs, args.output)
+        output_path = save_results(jobs, args.output, compact=args.compact_json)
         print(f"\nResults saved to: {output_path}")
 
     return 0
@@ -1,10 +1,12 @@
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import re
 
+from .browser import BROWSER_SLOTS
+from .http import get_session, cached_urljoin
+
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -23,117 +25,161 @@ SOCIAL_STUDIES_SEARCH_TERMS = [
 ]
 
 
+def _terms_pattern(terms: list) -> re.Pattern:
+    """Compile search terms into one alternation matched in a single scan."""
+    return re.compile('|'.join(re.escape(term.lower()) for term in terms))
+
+
+SEARCH_TERMS_RE = _terms_pattern(SOCIAL_STUDIES_SEARCH_TERMS)
+
+# Category links on the non-JS listing page, e.g. "High School Teaching (4)"
+CATEGORY_HREF_RE = re.compile(r'Category=')
+CATEGORY_TEXT_RE = re.compile(r'(.+?)\s*\((\d+)\)$')
+
+
+def _parse_listing(body_text: str, district_name: str, url: str,
+                   terms_re: re.Pattern) -> list[dict]:
+    """Parse JobID-delimited postings out of the page text.
+
+    Single-pass state machine: a 'JobID:' line opens a posting whose
+    title is the previous non-empty line, field labels like
+    'Position Type:' mark the next non-empty line as that field's
+    value, and the next 'JobID:' closes the posting - so fields can
+    never bleed in from a neighbouring record. Postings are kept when
+    title/position type mention any search term (one scan of the
+    combined pattern); duplicate titles are dropped as they stream in.
+    """
+    jobs = []
+    seen = set()
+
+    def flush(job):
+        title = job['title']
+        if not 5 < len(title) < 200:
+            return
+        match = terms_re.search(f"{title} {job['position_type']}".lower())
+        if not match:
+            return
+        key = title.lower()
+        if key in seen:
+            return
+        seen.add(key)
+        job['search_term'] = match.group(0)
+        jobs.append(job)
+
+    prev_nonempty = ''
+    current = None
+    pending_field = None
+
+    for line in body_text.split('\n'):
+        line = line.strip()
+
+        if 'JobID:' in line:
+            if current is not None:
+                flush(current)
+            current = {
+                'title': prev_nonempty,
+                'position_type': '',
+                'location': '',
+                'district': district_name,
+                'url': url,
+                'source': 'AppliTrack'
+            }
+            pending_field = None
+        elif current is not None:
+            if 'Position Type:' in line:
+                pending_field = 'position_type'
+            elif 'Location:' in line:
+                pending_field = 'location'
+            elif line and pending_field:
+                current[pending_field] = line
+                pending_field = None
+
+        if line:
+            prev_nonempty = line
+
+    if current is not None:
+        flush(current)
+
+    return jobs
+
+
+def _fetch_listing_text(url: str) -> str:
+    """Fetch the posting list over plain HTTP and flatten it to text.
+
+    AppliTrack listing pages are server-rendered, not a SPA - when the
+    response already carries the 'JobID:' markers we can skip Chromium
+    startup and the JS render entirely.
+    """
+    try:
+        response = get_session().get(url, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException:
+        return ''
+    return BeautifulSoup(response.text, 'lxml').get_text('\n')
+
+
 def scrape_applitrack(url: str, district_name: str, search_terms: list = None) -> list[dict]:
     """
     Scrape job listings from AppliTrack/Frontline career portals.
-    Uses Playwright to search for specific terms and extract job listings.
+    Tries a plain HTTP fetch first and only falls back to Playwright
+    when the response lacks the expected posting markers; search terms
+    are matched in a single pass over the page text either way.
     """
-    jobs = []
+    # Use social studies search terms by default
+    if search_terms is None:
+        terms_re = SEARCH_TERMS_RE
+    else:
+        terms_re = _terms_pattern(search_terms)
+
+    body_text = _fetch_listing_text(url)
+    if 'JobID:' in body_text:
+        return _parse_listing(body_text, district_name, url, terms_re)
 
     if not PLAYWRIGHT_AVAILABLE:
         return scrape_applitrack_basic(url, district_name)
 
-    # Use social studies search terms by default
-    if search_terms is None:
-        search_terms = SOCIAL_STUDIES_SEARCH_TERMS
-
     try:
-        with sync_playwright() as p:
+        with BROWSER_SLOTS, sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
 
-            # Try searching for each term
-            for term in search_terms:
-                page.goto(url, wait_until='networkidle', timeout=30000)
-                page.wait_for_timeout(2000)
-
-                # Find and use the search box
-                search_input = page.query_selector('#AppliTrackPostingSearch')
-                if search_input:
-                    search_input.fill(term)
-                    page.click('#LnkBtnSearch')
-                    page.wait_for_timeout(4000)
-
-                    # Get page content after search
-                    body_text = page.inner_text('body')
-
-                    # Parse job listings - look for JobID patterns
-                    # Job titles appear as standalone lines before "JobID:"
-                    lines = body_text.split('\n')
-
-                    for i, line in enumerate(lines):
-                        line = line.strip()
-
-                        # Look for job titles (line before JobID)
-                        if i + 1 < len(lines) and 'JobID:' in lines[i + 1]:
-                            title = line.strip()
-
-                            if title and len(title) > 5 and len(title) < 200:
-                                # Get position type from next few lines
-                                position_type = ''
-                                location = ''
-                                for j in range(i + 1, min(i + 15, len(lines))):
-                                    if 'Position Type:' in lines[j]:
-                                        # Next non-empty line is the position type
-                                        for k in range(j + 1, min(j + 3, len(lines))):
-                                            if lines[k].strip():
-                                                position_type = lines[k].strip()
-                                                break
-                                    if 'Location:' in lines[j]:
-                                        for k in range(j + 1, min(j + 3, len(lines))):
-                                            if lines[k].strip():
-                                                location = lines[k].strip()
-                                                break
-
-                                jobs.append({
-                                    'title': title,
-                                    'position_type': position_type,
-                                    'location': location,
-                                    'district': district_name,
-                                    'url': url,
-                                    'search_term': term,
-                                    'source': 'AppliTrack'
-                                })
+            # One page load shows every posting - no per-term searches
+            page.goto(url, wait_until='networkidle', timeout=30000)
+            try:
+                page.wait_for_selector('text=JobID:', timeout=8000)
+            except PlaywrightTimeoutError:
+                page.wait_for_timeout(1000)
 
+            body_text = page.inner_text('body')
             browser.close()
 
+        jobs = _parse_listing(body_text, district_name, url, terms_re)
+
     except Exception as e:
         print(f"  Error scraping {district_name}: {e}")
         return []
 
-    # Deduplicate
-    seen = set()
-    unique_jobs = []
-    for job in jobs:
-        key = job['title'].lower()
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
-
-    return unique_jobs
+    return jobs
 
 
 def scrape_applitrack_basic(url: str, district_name: str) -> list[dict]:
     """Basic scraping without JavaScript rendering - returns categories."""
     jobs = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'lxml')
 
         # Find category links
-        category_links = soup.find_all('a', href=re.compile(r'Category='))
+        category_links = soup.find_all('a', href=CATEGORY_HREF_RE)
 
         for link in category_links:
             text = link.get_text(strip=True)
-            match = re.match(r'(.+?)\s*\((\d+)\)$', text)
+            match = CATEGORY_TEXT_RE.match(text)
             if match:
                 category = match.group(1)
-                category_url = urljoin(url, link.get('href', ''))
+                category_url = cached_urljoin(url, link.get('href', ''))
                 jobs.append({
                     'title': category,
                     'category': category,
@@ -0,0 +1,17 @@
+"""Shared limit on concurrent Playwright browsers.
+
+The orchestrator scrapes districts from a thread pool, and each
+Playwright-backed scraper launches its own Chromium (the sync API cannot
+share one browser across threads). Unbounded, that means one headless
+browser per in-flight district - enough to thrash memory on small
+machines. This semaphore caps how many browsers run at once; HTTP-only
+scrapers are unaffected and keep the thread pool busy while browser
+slots are taken.
+"""
+
+import threading
+
+# Concurrent headless browsers allowed across all scraper threads
+MAX_BROWSERS = 4
+
+BROWSER_SLOTS = threading.Semaphore(MAX_BROWSERS)
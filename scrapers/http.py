@@ -0,0 +1,56 @@
+"""Shared HTTP session for the requests-based scrapers.
+
+When requests-cache is installed, responses are cached on disk for 30
+minutes so repeated runs (e.g. while tuning filters during development)
+skip the network round-trip for unchanged district pages. Otherwise a
+plain pooled session is used, which still reuses connections per host.
+"""
+
+import functools
+from urllib.parse import urljoin
+
+import requests
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
+# How long cached responses are reused
+CACHE_EXPIRE_SECONDS = 1800
+
+# Memoized urljoin: candidate links on one page share the same base and
+# often the same path prefix, so repeat (base, rel) pairs are common and
+# a cache hit skips the urllib.parse splitting entirely.
+cached_urljoin = functools.lru_cache(maxsize=8192)(urljoin)
+
+_session = None
+_cache_enabled = True
+
+
+def disable_cache():
+    """Force a plain session (backs the --no-cache CLI flag)."""
+    global _cache_enabled, _session
+    _cache_enabled = False
+    _session = None
+
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it lazily."""
+    global _session
+    if _session is None:
+        if REQUESTS_CACHE_AVAILABLE and _cache_enabled:
+            _session = requests_cache.CachedSession(
+                'http_cache',
+                expire_after=CACHE_EXPIRE_SECONDS,
+                allowable_codes=(200,)
+            )
+        else:
+            _session = requests.Session()
+        _session.headers.update(HEADERS)
+    return _session
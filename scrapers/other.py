@@ -1,121 +1,133 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from lxml import html as lxml_html
 import re
 
+from .http import get_session, cached_urljoin
 
-def scrape_other(url: str, district_name: str) -> list[dict]:
-    """
-    Scrape job listings from custom/other district websites.
-    Uses generic heuristics to find job postings.
+# Substring keywords that mark a link as job-related (matches anywhere,
+# e.g. 'job' also hits 'jobs'), compiled once instead of per link
+JOB_KEYWORDS_RE = re.compile(
+    r'job|position|opening|employment|career|vacancy|hiring|posting|opportunity|apply')
+
+# Common job title words
+JOB_TITLE_RE = re.compile(
+    r'teacher|principal|secretary|aide|coach|custodian|driver|nurse|counselor|'
+    r'specialist|director|coordinator|assistant|paraprofessional|substitute|'
+    r'tutor|librarian|technician', re.IGNORECASE)
+
+# Containers that usually hold the page's main content
+CONTENT_CLASS_RE = re.compile(r'(content|main|body)', re.IGNORECASE)
+
+# Navigation/menu link texts that are never job postings
+NAV_STOP = frozenset({'home', 'about', 'contact', 'login', 'search'})
+
+
+def parse_other_html(html: str, district_name: str, url: str) -> list[dict]:
+    """Run the three heuristic strategies over an already-fetched page.
+
+    Pure CPU work with no I/O, so it can be handed to a process pool
+    if the district list grows; all patterns are module-level.
+    Duplicate (title, url) pairs are dropped as they stream in.
     """
     jobs = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
-
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
+    seen = set()
+    tree = lxml_html.fromstring(html)
 
-        # Strategy 1: Look for links with job-related keywords in href or text
-        job_keywords = ['job', 'position', 'opening', 'employment', 'career', 'vacancy',
-                        'hiring', 'posting', 'opportunity', 'apply']
+    # Strategy 1: Look for links with job-related keywords in href or text.
+    # Lowercase each field once and triage in a single pass.
+    for link in tree.xpath('//a[@href]'):
+        href = link.get('href', '')
+        href_l = href.lower()
+        title = link.text_content().strip()
+        text_l = title.lower()
 
-        all_links = soup.find_all('a', href=True)
-        for link in all_links:
-            href = link.get('href', '').lower()
-            text = link.get_text(strip=True).lower()
+        # Skip navigation/menu links
+        if len(text_l) < 3 or len(text_l) > 200:
+            continue
+        if text_l in NAV_STOP:
+            continue
 
-            # Skip navigation/menu links
-            if len(text) < 3 or len(text) > 200:
-                continue
-            if text in ['home', 'about', 'contact', 'login', 'search']:
+        # Job-related href, or job keyword/title word in the link text
+        if (JOB_KEYWORDS_RE.search(href_l)
+                or JOB_KEYWORDS_RE.search(text_l)
+                or JOB_TITLE_RE.search(text_l)):
+            job_url = cached_urljoin(url, href)
+            if (title, job_url) in seen:
                 continue
+            seen.add((title, job_url))
+            jobs.append({
+                'title': title,
+                'district': district_name,
+                'url': job_url,
+                'source': 'District Website'
+            })
+
+    # Strategy 2: Look for list items that might be job postings
+    if not jobs:
+        for li in tree.iter('li'):
+            text = li.text_content().strip()
+            if JOB_TITLE_RE.search(text):
+                link = li.find('.//a')
+                if link is not None:
+                    title = link.text_content().strip() or text[:100]
+                    job_url = cached_urljoin(url, link.get('href', ''))
+                else:
+                    # No link, just text
+                    title = text[:100]
+                    job_url = url
+                if (title, job_url) in seen:
+                    continue
+                seen.add((title, job_url))
+                jobs.append({
+                    'title': title,
+                    'district': district_name,
+                    'url': job_url,
+                    'source': 'District Website'
+                })
 
-            # Check if this looks like a job posting link
-            is_job_link = any(kw in href for kw in job_keywords)
-            is_job_text = any(kw in text for kw in job_keywords)
-
-            # Also look for common job title patterns
-            job_title_patterns = [
-                r'teacher', r'principal', r'secretary', r'aide', r'coach',
-                r'custodian', r'driver', r'nurse', r'counselor', r'specialist',
-                r'director', r'coordinator', r'assistant', r'paraprofessional',
-                r'substitute', r'tutor', r'librarian', r'technician'
-            ]
-            is_job_title = any(re.search(p, text, re.I) for p in job_title_patterns)
-
-            if is_job_link or is_job_title:
-                title = link.get_text(strip=True)
-                if title and len(title) > 2:
-                    job_url = urljoin(url, link.get('href', ''))
+    # Strategy 3: Look for common page structures
+    if not jobs:
+        # Look for content divs
+        for div in tree.xpath('//div[@class]|//article[@class]|//section[@class]'):
+            if not CONTENT_CLASS_RE.search(div.get('class', '')):
+                continue
+            for p in div.xpath('.//p|.//li|.//h2|.//h3|.//h4'):
+                text = p.text_content().strip()
+                if JOB_TITLE_RE.search(text):
+                    link = p.find('.//a')
+                    if link is not None:
+                        job_url = cached_urljoin(url, link.get('href', ''))
+                    else:
+                        job_url = url
+                    if (text[:100], job_url) in seen:
+                        continue
+                    seen.add((text[:100], job_url))
                     jobs.append({
-                        'title': title,
+                        'title': text[:100],
                         'district': district_name,
                         'url': job_url,
                         'source': 'District Website'
                     })
 
-        # Strategy 2: Look for list items that might be job postings
-        if not jobs:
-            for li in soup.find_all('li'):
-                text = li.get_text(strip=True)
-                if any(re.search(p, text, re.I) for p in job_title_patterns):
-                    link = li.find('a')
-                    if link:
-                        title = link.get_text(strip=True) or text[:100]
-                        job_url = urljoin(url, link.get('href', ''))
-                        jobs.append({
-                            'title': title,
-                            'district': district_name,
-                            'url': job_url,
-                            'source': 'District Website'
-                        })
-                    else:
-                        # No link, just text
-                        jobs.append({
-                            'title': text[:100],
-                            'district': district_name,
-                            'url': url,
-                            'source': 'District Website'
-                        })
-
-        # Strategy 3: Look for common page structures
-        if not jobs:
-            # Look for content divs
-            content_divs = soup.find_all(['div', 'article', 'section'],
-                                          class_=re.compile(r'(content|main|body)', re.I))
-            for div in content_divs:
-                paragraphs = div.find_all(['p', 'li', 'h2', 'h3', 'h4'])
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if any(re.search(pat, text, re.I) for pat in job_title_patterns):
-                        link = p.find('a')
-                        if link:
-                            job_url = urljoin(url, link.get('href', ''))
-                        else:
-                            job_url = url
-                        jobs.append({
-                            'title': text[:100],
-                            'district': district_name,
-                            'url': job_url,
-                            'source': 'District Website'
-                        })
+    return jobs
+
+
+def scrape_other(url: str, district_name: str) -> list[dict]:
+    """
+    Scrape job listings from custom/other district websites.
+    Uses generic heuristics to find job postings.
+    Fetching and parsing are split so the parse step stays pure CPU.
+    """
+    jobs = []
+
+    try:
+        response = get_session().get(url, timeout=30)
+        response.raise_for_status()
+        jobs = parse_other_html(response.text, district_name, url)
 
     except requests.RequestException as e:
         print(f"  Error fetching {district_name}: {e}")
     except Exception as e:
         print(f"  Error parsing {district_name}: {e}")
 
-    # Deduplicate
-    seen = set()
-    unique_jobs = []
-    for job in jobs:
-        key = (job['title'], job['url'])
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
-
-    return unique_jobs
+    return jobs
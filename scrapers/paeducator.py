@@ -1,12 +1,23 @@
 import re
-from urllib.parse import urljoin
+from .browser import BROWSER_SLOTS
+from .http import cached_urljoin
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# One in-page map over the result links instead of three Playwright
+# round-trips (inner_text, get_attribute, evaluate) per link
+_COLLECT_LINKS_JS = """
+nodes => nodes.map(a => ({
+    text: a.innerText.trim(),
+    href: a.getAttribute('href') || '',
+    parentText: a.closest('div')?.innerText || ''
+}))
+"""
+
 
 def scrape_paeducator(url: str, district_name: str, district_filter: str = None) -> list[dict]:
     """
@@ -14,6 +25,7 @@ def scrape_paeducator(url: str, district_name: str, district_filter: str = None)
     PAEducator is a JavaScript-rendered SPA for Pennsylvania educator jobs.
     """
     jobs = []
+    seen = set()
     search_term = district_filter or district_name
 
     if not PLAYWRIGHT_AVAILABLE:
@@ -21,20 +33,30 @@ def scrape_paeducator(url: str, district_name: str, district_filter: str = None)
         return jobs
 
     try:
-        with sync_playwright() as p:
+        with BROWSER_SLOTS, sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
 
-            # Navigate to PAEducator search page
+            # Navigate to PAEducator search page and wait for the search
+            # input instead of sleeping a fixed 3s
             page.goto(url, wait_until='networkidle', timeout=30000)
-            page.wait_for_timeout(3000)
+            try:
+                page.wait_for_selector('input', timeout=8000)
+            except PlaywrightTimeoutError:
+                pass
 
             # Find the keyword search input and search for the district
             search_input = page.query_selector('input')
             if search_input:
                 search_input.fill(search_term)
                 search_input.press('Enter')
-                page.wait_for_timeout(4000)
+                # Wait for result links; short fallback sleep if the SPA
+                # renders results as plain text instead
+                try:
+                    page.wait_for_selector('a[href*="/job/"], a[href*="/posting/"]',
+                                           timeout=8000)
+                except PlaywrightTimeoutError:
+                    page.wait_for_timeout(1500)
 
             # Get the page text to parse job listings
             body = page.query_selector('body')
@@ -62,46 +84,44 @@ def scrape_paeducator(url: str, district_name: str, district_filter: str = None)
                             if search_term.lower() in parts[-1].lower():
                                 title = parts[0].strip()
 
-                        jobs.append({
-                            'title': title[:150],
-                            'district': district_name,
-                            'url': url,
-                            'source': 'PAEducator'
-                        })
-
-            # Alternative: try to find links with job details
-            job_links = page.query_selector_all('a[href*="/job/"], a[href*="/posting/"]')
-            for link in job_links:
-                try:
-                    text = link.inner_text().strip()
-                    href = link.get_attribute('href')
-
-                    # Check if related to our district
-                    parent_text = link.evaluate('el => el.closest("div")?.innerText || ""')
-                    if search_term.lower() in text.lower() or search_term.lower() in parent_text.lower():
-                        if text and len(text) > 2 and len(text) < 200:
-                            job_url = urljoin(url, href) if href else url
+                        title = title[:150]
+                        key = title.lower()
+                        if len(title) > 3 and key not in seen:
+                            seen.add(key)
                             jobs.append({
-                                'title': text,
+                                'title': title,
                                 'district': district_name,
-                                'url': job_url,
+                                'url': url,
                                 'source': 'PAEducator'
                             })
-                except Exception:
-                    continue
+
+            # Alternative: try to find links with job details, collected
+            # in one batched call
+            job_links = page.eval_on_selector_all(
+                'a[href*="/job/"], a[href*="/posting/"]', _COLLECT_LINKS_JS)
+            term_lower = search_term.lower()
+            for link in job_links:
+                text = link['text']
+                href = link['href']
+
+                # Check if related to our district
+                if term_lower in text.lower() or term_lower in link['parentText'].lower():
+                    if text and len(text) > 3 and len(text) < 200:
+                        key = text.lower()
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        job_url = cached_urljoin(url, href) if href else url
+                        jobs.append({
+                            'title': text,
+                            'district': district_name,
+                            'url': job_url,
+                            'source': 'PAEducator'
+                        })
 
             browser.close()
 
     except Exception as e:
         print(f"  Error scraping {district_name} from PAEducator: {e}")
 
-    # Deduplicate
-    seen = set()
-    unique_jobs = []
-    for job in jobs:
-        key = job['title'].lower()
-        if key not in seen and len(job['title']) > 3:
-            seen.add(key)
-            unique_jobs.append(job)
-
-    return unique_jobs
+    return jobs
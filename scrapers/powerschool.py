@@ -1,48 +1,77 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from lxml import html as lxml_html
 import re
 
+from .http import get_session, cached_urljoin
 
-def scrape_powerschool(url: str, district_name: str) -> list[dict]:
-    """
-    Scrape job listings from PowerSchool TalentEd (tedk12.com) career portals.
-    These sites typically have an index.aspx with job categories and listings.
+# Job posting link hrefs and listing container classes, compiled once
+JOB_HREF_RE = re.compile(r'(ViewJob|jobid|posting)', re.IGNORECASE)
+JOB_CLASS_RE = re.compile(r'(job|position|title)', re.IGNORECASE)
+
+
+def parse_powerschool_html(html: str, district_name: str, url: str) -> list[dict]:
+    """Parse job listings out of an already-fetched PowerSchool page.
+
+    Pure CPU work with no I/O, so it can be handed to a process pool
+    if the district list grows; all patterns are module-level.
+    Duplicate posting URLs are dropped as they stream in.
     """
     jobs = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
-
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
+    seen = set()
+    tree = lxml_html.fromstring(html)
 
-        # PowerSchool TalentEd typically uses divs with job listings
-        # Look for job posting links
-        job_links = soup.find_all('a', href=re.compile(r'(ViewJob|jobid|posting)', re.I))
+    # PowerSchool TalentEd typically uses divs with job listings
+    # Look for job posting links
+    for link in tree.xpath('//a[@href]'):
+        href = link.get('href', '')
+        if not JOB_HREF_RE.search(href):
+            continue
+        title = link.text_content().strip()
+        if title and len(title) > 2:
+            job_url = cached_urljoin(url, href)
+            if job_url in seen:
+                continue
+            seen.add(job_url)
+            jobs.append({
+                'title': title,
+                'district': district_name,
+                'url': job_url,
+                'source': 'PowerSchool'
+            })
 
-        for link in job_links:
-            title = link.get_text(strip=True)
-            if title and len(title) > 2:
-                job_url = urljoin(url, link.get('href', ''))
-                jobs.append({
-                    'title': title,
-                    'district': district_name,
-                    'url': job_url,
-                    'source': 'PowerSchool'
-                })
+    # Alternative: look for elements with specific classes
+    if not jobs:
+        for elem in tree.xpath('//div[@class]|//span[@class]|//td[@class]'):
+            if not JOB_CLASS_RE.search(elem.get('class', '')):
+                continue
+            link = elem.find('.//a')
+            if link is not None:
+                title = link.text_content().strip()
+                if title and len(title) > 2:
+                    job_url = cached_urljoin(url, link.get('href', ''))
+                    if job_url in seen:
+                        continue
+                    seen.add(job_url)
+                    jobs.append({
+                        'title': title,
+                        'district': district_name,
+                        'url': job_url,
+                        'source': 'PowerSchool'
+                    })
 
-        # Alternative: look for elements with specific classes
-        if not jobs:
-            for elem in soup.find_all(['div', 'span', 'td'],
-                                       class_=re.compile(r'(job|position|title)', re.I)):
-                link = elem.find('a')
-                if link:
-                    title = link.get_text(strip=True)
+    # Look for list items with job postings
+    if not jobs:
+        for li in tree.iter('li'):
+            link = li.find('.//a')
+            if link is not None and link.get('href'):
+                href = link.get('href', '').lower()
+                if 'job' in href or 'posting' in href or 'position' in href:
+                    title = link.text_content().strip()
                     if title and len(title) > 2:
-                        job_url = urljoin(url, link.get('href', ''))
+                        job_url = cached_urljoin(url, link.get('href', ''))
+                        if job_url in seen:
+                            continue
+                        seen.add(job_url)
                         jobs.append({
                             'title': title,
                             'district': district_name,
@@ -50,34 +79,25 @@ def scrape_powerschool(url: str, district_name: str) -> list[dict]:
                             'source': 'PowerSchool'
                         })
 
-        # Look for list items with job postings
-        if not jobs:
-            for li in soup.find_all('li'):
-                link = li.find('a')
-                if link and link.get('href'):
-                    href = link.get('href', '').lower()
-                    if 'job' in href or 'posting' in href or 'position' in href:
-                        title = link.get_text(strip=True)
-                        if title and len(title) > 2:
-                            job_url = urljoin(url, link.get('href', ''))
-                            jobs.append({
-                                'title': title,
-                                'district': district_name,
-                                'url': job_url,
-                                'source': 'PowerSchool'
-                            })
+    return jobs
+
+
+def scrape_powerschool(url: str, district_name: str) -> list[dict]:
+    """
+    Scrape job listings from PowerSchool TalentEd (tedk12.com) career portals.
+    These sites typically have an index.aspx with job categories and listings.
+    Fetching and parsing are split so the parse step stays pure CPU.
+    """
+    jobs = []
+
+    try:
+        response = get_session().get(url, timeout=30)
+        response.raise_for_status()
+        jobs = parse_powerschool_html(response.text, district_name, url)
 
     except requests.RequestException as e:
         print(f"  Error fetching {district_name}: {e}")
     except Exception as e:
         print(f"  Error parsing {district_name}: {e}")
 
-    # Deduplicate
-    seen = set()
-    unique_jobs = []
-    for job in jobs:
-        if job['url'] not in seen:
-            seen.add(job['url'])
-            unique_jobs.append(job)
-
-    return unique_jobs
+    return jobs
@@ -1,17 +1,198 @@
 import re
-from urllib.parse import urljoin
+from .browser import BROWSER_SLOTS
+from .http import cached_urljoin
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Words that indicate non-job links. All but the email check are anchored
+# literal prefixes, so str.startswith on a tuple (one C-level scan)
+# replaces the regex machinery entirely.
+EXCLUDE_PREFIXES = (
+    'open in',
+    'report',
+    'terms',
+    'privacy',
+    'help',
+    'contact',
+    'sign in',
+    'sign up',
+    'log in',
+    'register',
+    'google',
+    'maps',
+    'http',  # bare URLs
+)
+
+# Email addresses anywhere in the title
+EMAIL_RE = re.compile(r'@.*\.(org|com|edu|net)')
+
+
+def _is_excluded(title_lower: str) -> bool:
+    """True when an already-lowercased title is a non-job link."""
+    if title_lower.startswith(EXCLUDE_PREFIXES):
+        return True
+    return '@' in title_lower and EMAIL_RE.search(title_lower) is not None
+
+
+# One in-page pass gathering candidates for all three strategies.
+# Each query_selector/inner_text call is an IPC round-trip to the
+# browser; evaluating this collects everything in a single trip. The
+# body text is only serialized when both DOM strategies came up empty,
+# since that's the only case the fallback needs it.
+_COLLECT_ALL_JS = """
+() => {
+    const containers = [];
+    document.querySelectorAll(
+        '[class*="job"], [class*="posting"], [class*="position"], [class*="vacancy"]'
+    ).forEach(c => {
+        const t = c.querySelector('h2, h3, h4, [class*="title"]');
+        const a = c.querySelector('a');
+        if (t) containers.push({title: t.innerText.trim(),
+                                href: a ? a.getAttribute('href') : ''});
+    });
+    const links = Array.from(
+        document.querySelectorAll(
+            'a[href*="/job/"], a[href*="/posting/"], a[href*="jobID"]'),
+        a => ({title: a.innerText.trim(), href: a.getAttribute('href') || ''}));
+    const body = (containers.length || links.length)
+        ? '' : document.body.innerText;
+    return {containers, links, body};
+}
+"""
+
+# Subresources the scraper never reads; aborting them makes goto's
+# networkidle fire sooner on media-heavy pages
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+
+# Body-text fallback: a job-title word plus up to 50 trailing chars.
+# One anchored alternation behind \b - the non-capturing group makes
+# matches yield the whole title, not just the keyword, and lets re
+# apply its literal-prefix optimization.
+JOB_TITLE_RE = re.compile(
+    r'\b(?:Teacher|Principal|Counselor|Secretary|Aide|Coach|Driver|Nurse|'
+    r'Custodian|Paraprofessional|Substitute|Assistant|Director|Coordinator|'
+    r'Specialist|Technician)[^,\n]{0,50}', re.IGNORECASE)
+
+# The body-text fallback scans the full page text and yields lower
+# quality matches; flip this off to trust the DOM strategies alone
+ENABLE_TEXT_FALLBACK = True
+
+
+def _scrape_page(page, url: str, district_name: str) -> list[dict]:
+    """Load one SchoolSpring page and run the three extraction strategies.
+
+    Duplicate titles are dropped as they are collected; the lowercased
+    title doubles as the exclusion input and the dedupe key.
+    """
+    jobs = []
+    seen = set()
+
+    # Abort image/font/media/stylesheet requests - the scraper only
+    # reads text and hrefs. If routing fails, load normally.
+    try:
+        page.route('**/*', lambda route: route.abort()
+                   if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+                   else route.continue_())
+    except Exception:
+        pass
+
+    # Navigate to the district's SchoolSpring page and wait for job
+    # elements instead of sleeping a fixed 4s; on timeout fall through
+    # so the link and body-text strategies still run
+    page.goto(url, wait_until='networkidle', timeout=30000)
+    try:
+        page.wait_for_selector('[class*="job"], [class*="posting"], a[href*="/job/"]',
+                               timeout=8000)
+    except PlaywrightTimeoutError:
+        pass
+
+    # One evaluate call collects candidates for every strategy;
+    # filtering happens Python-side.
+    data = page.evaluate(_COLLECT_ALL_JS)
+
+    # Look for job listing elements - SchoolSpring uses specific patterns.
+    # Each later strategy only runs when the earlier ones found nothing.
+    for item in data['containers']:
+        title = item['title']
+        href = item['href']
+
+        # Cheapest gates first: length, then set membership, then the
+        # exclusion scan
+        if not 3 < len(title) < 150:
+            continue
+        key = title.lower()
+        if key in seen or _is_excluded(key):
+            continue
+        seen.add(key)
+        job_url = cached_urljoin(url, href) if href else url
+        jobs.append({
+            'title': title,
+            'district': district_name,
+            'url': job_url,
+            'source': 'SchoolSpring'
+        })
+
+    # Alternative: look for links containing job-related keywords
+    if not jobs:
+        for item in data['links']:
+            text = item['title']
+            href = item['href']
+
+            if not 3 < len(text) < 150:
+                continue
+            key = text.lower()
+            if key in seen or _is_excluded(key):
+                continue
+            seen.add(key)
+            job_url = cached_urljoin(url, href)
+            jobs.append({
+                'title': text,
+                'district': district_name,
+                'url': job_url,
+                'source': 'SchoolSpring'
+            })
+
+    # If still no jobs, try to find any text that looks like a job
+    # posting. The evaluate skips serializing the body when the DOM
+    # strategies had candidates, so re-fetch it for the rare case they
+    # had some but every one was filtered out.
+    if not jobs and ENABLE_TEXT_FALLBACK:
+        text = data['body'] or page.inner_text('body')
+        # finditer stops scanning once 10 titles are kept, instead
+        # of findall materializing every match on a big page
+        for match in JOB_TITLE_RE.finditer(text):
+            if len(jobs) >= 10:
+                break
+            title = match.group(0).strip()
+            if not 5 < len(title) < 100:
+                continue
+            key = title.lower()
+            if key in seen or _is_excluded(key):
+                continue
+            seen.add(key)
+            jobs.append({
+                'title': title,
+                'district': district_name,
+                'url': url,
+                'source': 'SchoolSpring'
+            })
+
+    return jobs
 
-def scrape_schoolspring(url: str, district_name: str) -> list[dict]:
+
+def scrape_schoolspring(url: str, district_name: str, browser=None) -> list[dict]:
     """
     Scrape job listings from SchoolSpring career portals.
     SchoolSpring is a JavaScript-rendered SPA, requiring browser automation.
+
+    Pass an open Playwright browser to reuse it across districts - a new
+    context is created (and closed) per URL, skipping the 0.5-2s Chromium
+    cold-start on every call after the first. Note the sync API is not
+    thread-safe, so a shared browser must only be used from one thread.
     """
     jobs = []
 
@@ -19,112 +200,22 @@ def scrape_schoolspring(url: str, district_name: str) -> list[dict]:
         print(f"  Playwright not installed - skipping {district_name}")
         return jobs
 
-    # Words that indicate non-job links
-    exclude_patterns = [
-        r'^open in',
-        r'^report',
-        r'^terms',
-        r'^privacy',
-        r'^help',
-        r'^contact',
-        r'^sign in',
-        r'^sign up',
-        r'^log in',
-        r'^register',
-        r'@.*\.(org|com|edu|net)',  # email addresses
-        r'^google',
-        r'^maps',
-        r'^http',  # bare URLs
-    ]
-
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
-            # Navigate to the district's SchoolSpring page
-            page.goto(url, wait_until='networkidle', timeout=30000)
-            page.wait_for_timeout(4000)
-
-            # Look for job listing elements - SchoolSpring uses specific patterns
-            # Try to find job cards or listing containers
-            job_containers = page.query_selector_all('[class*="job"], [class*="posting"], [class*="position"], [class*="vacancy"]')
-
-            for container in job_containers:
+        if browser is not None:
+            context = browser.new_context()
+            try:
+                jobs = _scrape_page(context.new_page(), url, district_name)
+            finally:
+                context.close()
+        else:
+            with BROWSER_SLOTS, sync_playwright() as p:
+                own_browser = p.chromium.launch(headless=True)
                 try:
-                    title_elem = container.query_selector('h2, h3, h4, [class*="title"]')
-                    if title_elem:
-                        title = title_elem.inner_text().strip()
-                        link = container.query_selector('a')
-                        href = link.get_attribute('href') if link else ''
-
-                        if title and len(title) > 3 and len(title) < 150:
-                            # Check if this looks like a real job
-                            if not any(re.search(p, title, re.I) for p in exclude_patterns):
-                                job_url = urljoin(url, href) if href else url
-                                jobs.append({
-                                    'title': title,
-                                    'district': district_name,
-                                    'url': job_url,
-                                    'source': 'SchoolSpring'
-                                })
-                except Exception:
-                    continue
-
-            # Alternative: look for links containing job-related keywords
-            if not jobs:
-                all_links = page.query_selector_all('a[href*="/job/"], a[href*="/posting/"], a[href*="jobID"]')
-                for link in all_links:
-                    try:
-                        text = link.inner_text().strip()
-                        href = link.get_attribute('href')
-
-                        if text and len(text) > 3 and len(text) < 150:
-                            if not any(re.search(p, text, re.I) for p in exclude_patterns):
-                                job_url = urljoin(url, href)
-                                jobs.append({
-                                    'title': text,
-                                    'district': district_name,
-                                    'url': job_url,
-                                    'source': 'SchoolSpring'
-                                })
-                    except Exception:
-                        continue
-
-            # If still no jobs, try to find any text that looks like a job posting
-            if not jobs:
-                # Look for common job title patterns in page text
-                body = page.query_selector('body')
-                if body:
-                    text = body.inner_text()
-                    job_patterns = [
-                        r'(Teacher|Principal|Counselor|Secretary|Aide|Coach|Driver|Nurse|Custodian|Paraprofessional|Substitute|Assistant|Director|Coordinator|Specialist|Technician)[^,\n]{0,50}',
-                    ]
-                    for pattern in job_patterns:
-                        matches = re.findall(pattern, text, re.I)
-                        for match in matches[:10]:  # Limit to first 10
-                            title = match.strip()
-                            if len(title) > 5 and len(title) < 100:
-                                if not any(re.search(p, title, re.I) for p in exclude_patterns):
-                                    jobs.append({
-                                        'title': title,
-                                        'district': district_name,
-                                        'url': url,
-                                        'source': 'SchoolSpring'
-                                    })
-
-            browser.close()
+                    jobs = _scrape_page(own_browser.new_page(), url, district_name)
+                finally:
+                    own_browser.close()
 
     except Exception as e:
         print(f"  Error scraping {district_name}: {e}")
 
-    # Deduplicate
-    seen = set()
-    unique_jobs = []
-    for job in jobs:
-        key = job['title'].lower()
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
-
-    return unique_jobs
+    return jobs
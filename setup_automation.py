@@ -6,6 +6,7 @@ Interactive setup script for automated job scraper notifications.
 import json
 import os
 import subprocess
+import sys
 from pathlib import Path
 
 script_dir = Path(__file__).parent
@@ -51,13 +52,20 @@ def setup_settings():
         print("\n⚠️  No notifications configured!")
         return None
 
-    # Save settings
+    # Save settings: write a 0o600 temp file and rename it into place,
+    # so a crash mid-write can't corrupt settings.json and the file is
+    # never readable by others (chmod-after-write left a window)
     settings_path = script_dir / 'settings.json'
-    with open(settings_path, 'w') as f:
-        json.dump(settings, f, indent=2)
-
-    # Secure the file (readable only by owner)
-    os.chmod(settings_path, 0o600)
+    tmp_path = settings_path.with_suffix('.tmp')
+    tmp_path.unlink(missing_ok=True)  # stale temp from an earlier crash
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(settings, f, indent=2)
+        os.replace(tmp_path, settings_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     print(f"\n✓ Settings saved to {settings_path}")
     return settings
@@ -95,7 +103,9 @@ def setup_cron():
         print(f"  python3 {script_dir}/run_automated.py")
         return
 
-    python_path = subprocess.run(['which', 'python3'], capture_output=True, text=True).stdout.strip()
+    # The interpreter running the wizard - no 'which python3' subprocess,
+    # and cron gets the same Python (e.g. a venv) the deps were installed in
+    python_path = sys.executable
     script_path = script_dir / 'run_automated.py'
     log_path = script_dir / 'cron.log'
 
@@ -0,0 +1,15 @@
+-- Bulk "touch" for jobs seen again in a scrape.
+-- Lets the scraper refresh last_seen_at/is_active for every currently-open
+-- job in one RPC instead of re-upserting every row on every run.
+
+CREATE OR REPLACE FUNCTION touch_jobs(keys JSONB)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE jobs
+    SET last_seen_at = NOW(),
+        is_active = TRUE
+    FROM jsonb_to_recordset(keys) AS k(district TEXT, title TEXT)
+    WHERE jobs.district = k.district
+      AND jobs.title = k.title;
+$$;
@@ -0,0 +1,7 @@
+-- Partial covering index for the per-run active-jobs snapshot.
+-- get_active_jobs selects district/title for is_active rows on every run;
+-- this index lets Postgres serve it without scanning inactive history.
+
+CREATE INDEX IF NOT EXISTS idx_jobs_active_district_title
+    ON jobs (district, title)
+    WHERE is_active;